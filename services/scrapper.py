@@ -13,6 +13,7 @@ from urllib.parse import urljoin, urlparse
 from datetime import datetime
 
 from models.insights_models import FAQ, BrandInsights, ContactInfo, Product, SocialHandle
+from services.text_miner import TextMiningService
 
 
 class ShopifyScraperService:
@@ -28,6 +29,7 @@ class ShopifyScraperService:
         'DNT': '1',
         'Upgrade-Insecure-Requests': '1',
         })
+        self.text_miner = TextMiningService()
 
     
     def extract_insights(self, website_url: str) -> BrandInsights:
@@ -338,26 +340,7 @@ class ShopifyScraperService:
     
     def _parse_faqs_from_page(self, soup: BeautifulSoup) -> List[FAQ]:
         """Parse FAQs from a page"""
-        faqs = []
-        
-        # Look for FAQ sections
-        faq_sections = soup.find_all(['div', 'section'], class_=re.compile(r'faq|question|accordion', re.I))
-        
-        for section in faq_sections:
-            # Look for question-answer pairs
-            questions = section.find_all(['h3', 'h4', 'h5', 'dt', 'div'], class_=re.compile(r'question|title|header', re.I))
-            
-            for question in questions:
-                q_text = question.get_text().strip()
-                if q_text and len(q_text) > 10:
-                    # Find corresponding answer
-                    answer = question.find_next_sibling(['p', 'div', 'dd'])
-                    if answer:
-                        a_text = answer.get_text().strip()
-                        if a_text:
-                            faqs.append(FAQ(question=q_text, answer=a_text))
-        
-        return faqs[:10]  # Limit to 10 FAQs
+        return self.text_miner.extract_faqs(soup, limit=10)
     
     def _extract_social_handles(self, soup: BeautifulSoup) -> List[SocialHandle]:
         """Extract social media handles"""
@@ -400,30 +383,15 @@ class ShopifyScraperService:
     
     def _extract_contact_info(self, soup: BeautifulSoup, base_url: str) -> ContactInfo:
         """Extract contact information"""
-        contact_info = ContactInfo()
-        
-        # Extract from main page
-        page_text = soup.get_text()
-        
-        # Email patterns
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, page_text)
-        contact_info.emails = list(set(emails))
-        
-        # Phone patterns
-        phone_pattern = r'(\+?1?[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        phones = re.findall(phone_pattern, page_text)
-        contact_info.phones = [''.join(phone).strip() for phone in phones if phone]
+        # Extract from main page (footer, contact blocks, links and JSON-LD only)
+        contact_info = self.text_miner.extract_contact_info(soup)
         
-        # Try contact page
+        # Try contact page, where the main content is relevant as well
         try:
             contact_url = urljoin(base_url, '/pages/contact')
             contact_soup = self._get_page_soup(contact_url)
             if contact_soup:
-                contact_text = contact_soup.get_text()
-                additional_emails = re.findall(email_pattern, contact_text)
-                contact_info.emails.extend(additional_emails)
-                contact_info.emails = list(set(contact_info.emails))
+                self.text_miner.extract_contact_info(contact_soup, contact_info, include_main=True)
         except Exception as e:
             logger.warning(f"Failed to extract contact info: {e}")
         
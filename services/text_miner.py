@@ -0,0 +1,311 @@
+import html
+import json
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import unquote
+
+from bs4 import BeautifulSoup, Tag
+
+from models.insights_models import FAQ, ContactInfo
+from utils.logger import logger
+
+
+# Precompiled patterns. Matches can only start at a token boundary and every
+# quantifier works on a single character class, so scanning stays linear.
+EMAIL_PATTERN = re.compile(r'(?<![A-Za-z0-9._%+-])[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)+')
+PHONE_RUN_PATTERN = re.compile(r'(?<![\w+(])\+?\(?\d{1,15}\)?(?:[ \t.-]{1,3}\(?\d{1,15}\)?)*')
+PHONE_GROUP_PATTERN = re.compile(r'\+?\(?\d+\)?')
+YEAR_PATTERN = re.compile(r'(?:19|20)\d\d')
+NON_DIGIT_PATTERN = re.compile(r'\D')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+HTML_TAG_PATTERN = re.compile(r'<[^>]*>')
+ADDRESS_SEPARATOR_PATTERN = re.compile(r' ?(?:, ?)+')
+
+CONTACT_REGION_PATTERN = re.compile(r'contact|footer|address|support|customer-?service', re.I)
+FAQ_SECTION_PATTERN = re.compile(r'faq|question|accordion', re.I)
+FAQ_QUESTION_PATTERN = re.compile(r'question|title|header', re.I)
+
+ORGANIZATION_TYPES = {'Organization', 'Corporation', 'OnlineStore', 'Store', 'LocalBusiness', 'ClothingStore'}
+ADDRESS_FIELDS = ['streetAddress', 'addressLocality', 'addressRegion', 'postalCode', 'addressCountry']
+ASSET_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp', 'svg', 'avif', 'css', 'js'}
+REGION_TAGS = {'div', 'section', 'aside'}
+
+
+class TextMiningService:
+    """Extracts contact details and FAQs from the relevant regions of a page"""
+
+    def __init__(self):
+        self._last_scan = None
+
+    def extract_contact_info(self, soup: BeautifulSoup, contact_info: Optional[ContactInfo] = None,
+                             include_main: bool = False) -> ContactInfo:
+        """Mine emails, phones and address from a page into contact_info"""
+        contact_info = contact_info or ContactInfo()
+        emails = {email.lower() for email in contact_info.emails}
+        phones = {self._phone_key(phone) for phone in contact_info.phones}
+
+        def add_email(email: str):
+            email = email.strip().strip('.')
+            if email and email.lower() not in emails and self._is_valid_email(email):
+                emails.add(email.lower())
+                contact_info.emails.append(email)
+
+        def add_phone(phone: str, min_digits: int = 10):
+            phone = WHITESPACE_PATTERN.sub(' ', phone).strip()
+            digits = NON_DIGIT_PATTERN.sub('', phone)
+            key = self._phone_key(phone)
+            if min_digits <= len(digits) <= 15 and len(set(digits)) > 1 and key not in phones:
+                phones.add(key)
+                contact_info.phones.append(phone)
+
+        scan = self._scan_page(soup)
+
+        # Structured data is the most reliable source, so it goes first
+        for node in self._iter_json_ld(scan['scripts']):
+            try:
+                if not self._has_type(node, ORGANIZATION_TYPES):
+                    continue
+                contact_points = node.get('contactPoint') or []
+                if isinstance(contact_points, dict):
+                    contact_points = [contact_points]
+                for entry in [node] + [cp for cp in contact_points if isinstance(cp, dict)]:
+                    if isinstance(entry.get('email'), str):
+                        add_email(entry['email'].replace('mailto:', ''))
+                    if isinstance(entry.get('telephone'), str):
+                        add_phone(entry['telephone'], min_digits=7)
+                if not contact_info.address:
+                    contact_info.address = self._format_address(node.get('address'))
+            except (AttributeError, TypeError, ValueError) as e:
+                logger.debug(f"Skipping malformed JSON-LD node: {e}")
+
+        # mailto: and tel: links carry clean values without any text scanning
+        for link in scan['links']:
+            href = unquote(link['href'])
+            scheme, _, value = href.partition(':')
+            value = value.split('?')[0]
+            if scheme.lower() == 'mailto':
+                for email in value.split(','):
+                    add_email(email)
+            else:
+                add_phone(value, min_digits=7)
+
+        # Free text is only scanned inside footer/contact blocks
+        for region in self._contact_regions(soup, scan, include_main):
+            text = region.get_text(separator=' ')
+            for email in EMAIL_PATTERN.findall(text):
+                add_email(email)
+            for phone in self._find_phones(text):
+                add_phone(phone)
+            if not contact_info.address:
+                contact_info.address = self._extract_address_from_region(region)
+
+        return contact_info
+
+    def extract_faqs(self, soup: BeautifulSoup, limit: int = 10) -> List[FAQ]:
+        """Extract FAQs from FAQPage structured data, falling back to the DOM"""
+        scan = self._scan_page(soup)
+        faqs = []
+        for node in self._iter_json_ld(scan['scripts']):
+            try:
+                if not self._has_type(node, {'FAQPage'}):
+                    continue
+                entities = node.get('mainEntity') or []
+                if isinstance(entities, dict):
+                    entities = [entities]
+                for entity in entities:
+                    if not isinstance(entity, dict):
+                        continue
+                    answer = entity.get('acceptedAnswer') or {}
+                    if isinstance(answer, list):
+                        answer = answer[0] if answer else {}
+                    q_text = self._clean_html(entity.get('name'))
+                    a_text = self._clean_html(answer.get('text') if isinstance(answer, dict) else None)
+                    if q_text and a_text:
+                        faqs.append(FAQ(question=q_text, answer=a_text))
+            except (AttributeError, TypeError, ValueError) as e:
+                logger.debug(f"Skipping malformed JSON-LD node: {e}")
+        if faqs:
+            return faqs[:limit]
+
+        seen = set()
+        for section in scan['faq_sections']:
+            # <details><summary>Q</summary>A</details> accordions
+            pairs = [(summary, None) for summary in section.find_all('summary') if summary.parent.name == 'details']
+            pairs += [
+                (question, question.find_next_sibling(['p', 'div', 'dd']))
+                for question in section.find_all(['h3', 'h4', 'h5', 'dt', 'div'], class_=FAQ_QUESTION_PATTERN)
+            ]
+            for question, answer in pairs:
+                if id(question) in seen:
+                    continue
+                seen.add(id(question))
+                q_text = question.get_text().strip()
+                if len(q_text) <= 10:
+                    continue
+                if question.name == 'summary':
+                    a_text = ''.join(
+                        sibling.get_text() if isinstance(sibling, Tag) else str(sibling)
+                        for sibling in question.next_siblings
+                    ).strip()
+                elif answer is not None:
+                    a_text = answer.get_text().strip()
+                else:
+                    continue
+                if a_text:
+                    faqs.append(FAQ(question=q_text, answer=a_text))
+                    if len(faqs) >= limit:
+                        return faqs
+
+        return faqs
+
+    def _scan_page(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """Collect JSON-LD scripts, mailto:/tel: links, contact regions and FAQ sections in one traversal"""
+        # The home page is mined for both contacts and FAQs, so reuse its scan
+        cached = self._last_scan
+        if cached and cached[0] is soup:
+            return cached[1]
+
+        scan = {'scripts': [], 'links': [], 'regions': [], 'faq_sections': [], 'main': None}
+        region_ids = set()
+
+        # find_all(True) with plain checks is much cheaper than a function filter
+        for tag in soup.find_all(True):
+            name = tag.name
+            if name == 'script':
+                if tag.get('type') == 'application/ld+json':
+                    scan['scripts'].append(tag)
+            elif name == 'a':
+                if tag.get('href', '').lower().startswith(('mailto:', 'tel:')):
+                    scan['links'].append(tag)
+            elif name == 'main':
+                if scan['main'] is None:
+                    scan['main'] = tag
+            elif name in ('footer', 'address') or name in REGION_TAGS:
+                classes = ' '.join(tag.get('class') or [])
+                if name in ('div', 'section') and FAQ_SECTION_PATTERN.search(classes):
+                    scan['faq_sections'].append(tag)
+                if (name in ('footer', 'address') or CONTACT_REGION_PATTERN.search(classes)
+                        or CONTACT_REGION_PATTERN.search(tag.get('id') or '')):
+                    # Document order puts ancestors first, so nested blocks are skipped
+                    if not any(id(parent) in region_ids for parent in tag.parents):
+                        region_ids.add(id(tag))
+                        scan['regions'].append(tag)
+
+        self._last_scan = (soup, scan)
+        return scan
+
+    def _contact_regions(self, soup: BeautifulSoup, scan: Dict[str, Any], include_main: bool) -> List[Tag]:
+        """Contact regions to scan, optionally led by the page's main content"""
+        if not include_main:
+            return scan['regions']
+        main = scan['main'] or soup.body or soup
+        return [main] + [
+            region for region in scan['regions']
+            if not any(parent is main for parent in region.parents)
+        ]
+
+    def _iter_json_ld(self, scripts: List[Tag]) -> Iterator[Dict[str, Any]]:
+        """Yield every JSON-LD node on the page, flattening lists and @graph"""
+        for script in scripts:
+            try:
+                data = json.loads(script.string or '')
+            except ValueError as e:
+                logger.debug(f"Skipping invalid JSON-LD block: {e}")
+                continue
+            stack = [data]
+            while stack:
+                item = stack.pop()
+                if isinstance(item, list):
+                    stack.extend(reversed(item))
+                elif isinstance(item, dict):
+                    if isinstance(item.get('@graph'), list):
+                        stack.extend(reversed(item['@graph']))
+                    yield item
+
+    def _has_type(self, node: Dict[str, Any], types: set) -> bool:
+        node_type = node.get('@type')
+        if isinstance(node_type, list):
+            return any(isinstance(t, str) and t in types for t in node_type)
+        return isinstance(node_type, str) and node_type in types
+
+    def _find_phones(self, text: str) -> List[str]:
+        """Split runs of digit groups into phone numbers, aligned to the end of each run"""
+        phones = []
+        for run in PHONE_RUN_PATTERN.finditer(text):
+            if text[run.end():run.end() + 1].isalnum():
+                continue
+            run_text = run.group()
+            groups = list(PHONE_GROUP_PATTERN.finditer(run_text))
+            tokens = [group.group() for group in groups]
+            digit_counts = [len(NON_DIGIT_PATTERN.sub('', token)) for token in tokens]
+
+            # Numbers usually follow whatever precedes them in a run (zip codes,
+            # hours, suite numbers), so take groups from the right until a
+            # national number is complete, then add a country prefix if present
+            run_phones = []
+            j = len(groups)
+            while j > 0:
+                i, national = j, 0
+                while i > 0 and national < 10 and not tokens[i - 1].startswith('+'):
+                    i -= 1
+                    national += digit_counts[i]
+                start, total = i, national
+                prefix = tokens[i - 1] if i > 0 else ''
+                if (prefix.startswith('+') or (prefix.startswith('00') and national >= 9)
+                        or (prefix == '1' and national == 10)):
+                    start -= 1
+                    total += digit_counts[start]
+                needed = 9 if start < i else 10
+                if (needed <= national and total <= 15
+                        and not all(YEAR_PATTERN.fullmatch(token) for token in tokens[i:j])):
+                    run_phones.append(run_text[groups[start].start():groups[j - 1].end()])
+                j = start if start < j else j - 1
+            phones.extend(reversed(run_phones))
+        return phones
+
+    def _phone_key(self, phone: str) -> str:
+        """Dedupe key that ignores formatting and a leading country prefix"""
+        digits = NON_DIGIT_PATTERN.sub('', phone)
+        return digits[-10:] if len(digits) > 10 else digits
+
+    def _extract_address_from_region(self, region: Tag) -> Optional[str]:
+        """Read an address from <address> tags or schema.org microdata"""
+        if region.name == 'address':
+            address_tag = region
+        else:
+            address_tag = region.find('address') or region.find(attrs={'itemprop': 'address'})
+        if not address_tag:
+            return None
+        text = WHITESPACE_PATTERN.sub(' ', address_tag.get_text(separator=', ')).strip(' ,')
+        text = ADDRESS_SEPARATOR_PATTERN.sub(', ', text)
+        return text or None
+
+    def _format_address(self, address: Any) -> Optional[str]:
+        """Format a JSON-LD address, which may be a string or a PostalAddress"""
+        if isinstance(address, list):
+            address = address[0] if address else None
+        if isinstance(address, str):
+            return WHITESPACE_PATTERN.sub(' ', address).strip() or None
+        if isinstance(address, dict):
+            parts = []
+            for field in ADDRESS_FIELDS:
+                value = address.get(field)
+                if isinstance(value, dict):
+                    value = value.get('name')
+                if isinstance(value, str) and value.strip():
+                    parts.append(value.strip())
+            return ', '.join(parts) or None
+        return None
+
+    def _is_valid_email(self, email: str) -> bool:
+        """Reject matches that are really asset names such as logo@2x.png"""
+        if not EMAIL_PATTERN.fullmatch(email):
+            return False
+        tld = email.rsplit('.', 1)[-1].lower()
+        return tld.isalpha() and len(tld) >= 2 and tld not in ASSET_EXTENSIONS
+
+    def _clean_html(self, value: Any) -> Optional[str]:
+        if not isinstance(value, str):
+            return None
+        text = html.unescape(HTML_TAG_PATTERN.sub(' ', value))
+        return WHITESPACE_PATTERN.sub(' ', text).strip() or None
@@ -0,0 +1,160 @@
+import pytest
+from bs4 import BeautifulSoup
+
+from models.insights_models import ContactInfo
+from services.text_miner import TextMiningService
+
+
+miner = TextMiningService()
+
+
+def soup_of(markup: str) -> BeautifulSoup:
+    return BeautifulSoup(markup, 'html.parser')
+
+
+def test_organization_json_ld_in_graph():
+    soup = soup_of("""
+    <script type="application/ld+json">
+    {"@graph": [
+        {"@type": "WebSite", "name": "Shop"},
+        {"@type": ["Organization", "OnlineStore"], "email": "hello@shop.com",
+         "contactPoint": {"@type": "ContactPoint", "telephone": "+1-555-123-4567"},
+         "address": {"@type": "PostalAddress", "streetAddress": "1 Main St",
+                     "addressLocality": "Springfield", "postalCode": "12345",
+                     "addressCountry": {"name": "US"}}}
+    ]}
+    </script>
+    """)
+    contact_info = miner.extract_contact_info(soup)
+    assert contact_info.emails == ['hello@shop.com']
+    assert contact_info.phones == ['+1-555-123-4567']
+    assert contact_info.address == '1 Main St, Springfield, 12345, US'
+
+
+def test_odd_json_ld_types_are_ignored():
+    soup = soup_of("""
+    <script type="application/ld+json">{"@type": {"x": 1}, "email": "a@b.com"}</script>
+    <script type="application/ld+json">[{"@type": [{"x": 1}, "Organization"], "email": "org@shop.com"}]</script>
+    <script type="application/ld+json">{not json</script>
+    """)
+    assert miner.extract_contact_info(soup).emails == ['org@shop.com']
+    assert miner.extract_faqs(soup) == []
+
+
+def test_faq_page_json_ld():
+    soup = soup_of("""
+    <script type="application/ld+json">
+    {"@type": "FAQPage", "mainEntity": [
+        {"@type": "Question", "name": "Do you ship abroad?",
+         "acceptedAnswer": {"@type": "Answer", "text": "<p>Yes, &amp; for free.</p>"}},
+        {"@type": "Question", "name": "No answer here?"}
+    ]}
+    </script>
+    """)
+    faqs = miner.extract_faqs(soup)
+    assert [(faq.question, faq.answer) for faq in faqs] == [('Do you ship abroad?', 'Yes, & for free.')]
+
+
+def test_details_accordion_faqs():
+    soup = soup_of("""
+    <div class="faq-list">
+      <details><span>#1</span><summary>How long is delivery?</summary><p>Three to five days.</p> Tracked.</details>
+    </div>
+    """)
+    faqs = miner.extract_faqs(soup)
+    assert [(faq.question, faq.answer) for faq in faqs] == [('How long is delivery?', 'Three to five days. Tracked.')]
+
+
+def test_mailto_and_tel_links():
+    soup = soup_of("""
+    <a href="mailto:Support%40shop.com?subject=Hi">Mail</a>
+    <a href="tel:+44 20 7946 0018">Call</a>
+    <a href="/pages/contact">Contact</a>
+    """)
+    contact_info = miner.extract_contact_info(soup)
+    assert contact_info.emails == ['Support@shop.com']
+    assert contact_info.phones == ['+44 20 7946 0018']
+
+
+def test_phone_false_positives_and_negatives():
+    soup = soup_of("""
+    <p>Order 5551234567 now for 2999 rupees</p>
+    <footer>
+      <p>&copy; 2019 2020 2021 Shop. SKU 12345.</p>
+      <p>Call 555 123 4567 555 765 4321 or (555) 222-3333, intl +91 98765 43210</p>
+    </footer>
+    """)
+    contact_info = miner.extract_contact_info(soup)
+    assert contact_info.phones == ['555 123 4567', '555 765 4321', '(555) 222-3333', '+91 98765 43210']
+
+
+@pytest.mark.parametrize('text, phone', [
+    ('Springfield, IL 62704 555-123-4567', '555-123-4567'),
+    ('Hours Mon-Fri 9-5 555-123-4567', '555-123-4567'),
+    ('Suite 100 555-123-4567', '555-123-4567'),
+    ('Order #1001 - 555 123 4567', '555 123 4567'),
+])
+def test_short_numbers_before_a_phone_are_not_merged(text, phone):
+    soup = soup_of(f'<footer>{text}</footer>')
+    assert miner.extract_contact_info(soup).phones == [phone]
+
+
+def test_zip_code_and_phone_in_minified_footer():
+    soup = soup_of('<footer><p>Springfield, IL 62704</p><p>555-123-4567</p></footer>')
+    assert miner.extract_contact_info(soup).phones == ['555-123-4567']
+
+
+def test_same_phone_from_different_sources_is_kept_once():
+    soup = soup_of("""
+    <script type="application/ld+json">{"@type": "Organization", "telephone": "+1 555 123 4567"}</script>
+    <a href="TEL:5551234567">Call</a>
+    <footer>Call us: 1-555-123-4567</footer>
+    """)
+    assert miner.extract_contact_info(soup).phones == ['+1 555 123 4567']
+
+
+def test_asset_names_are_not_emails():
+    soup = soup_of('<footer>logo@2x.png icon@3x.webp team@shop.co.uk</footer>')
+    assert miner.extract_contact_info(soup).emails == ['team@shop.co.uk']
+
+
+def test_nested_regions_are_scanned_once():
+    soup = soup_of("""
+    <div class="site-footer"><footer><address>1 Main St<br>Springfield</address>
+    <p>help@shop.com 555-123-4567</p></footer></div>
+    """)
+    contact_info = miner.extract_contact_info(soup)
+    assert contact_info.address == '1 Main St, Springfield'
+    assert contact_info.emails == ['help@shop.com']
+    assert contact_info.phones == ['555-123-4567']
+
+
+def test_faqs_and_contacts_from_the_same_page():
+    soup = soup_of("""
+    <script type="application/ld+json">[
+        {"@type": "Organization", "email": "hello@shop.com"},
+        {"@type": "FAQPage", "mainEntity": {"name": "Can I return items?",
+                                             "acceptedAnswer": {"text": "Within 30 days."}}}
+    ]</script>
+    <div class="faq"><h3 class="question">Is this ignored here?</h3><p>Yes.</p></div>
+    """)
+    assert miner.extract_contact_info(soup).emails == ['hello@shop.com']
+    faqs = miner.extract_faqs(soup)
+    assert [(faq.question, faq.answer) for faq in faqs] == [('Can I return items?', 'Within 30 days.')]
+
+
+def test_contact_page_merges_and_dedupes():
+    home = soup_of('<footer>help@shop.com</footer>')
+    contact_page = soup_of('<main><p>HELP@shop.com or sales@shop.com</p></main>')
+    contact_info = miner.extract_contact_info(home)
+    miner.extract_contact_info(contact_page, contact_info, include_main=True)
+    assert contact_info.emails == ['help@shop.com', 'sales@shop.com']
+
+
+def test_microdata_address():
+    soup = soup_of("""
+    <div class="contact-block">
+      <span itemprop="address"><span>12 High Street</span> <span>London</span></span>
+    </div>
+    """)
+    assert miner.extract_contact_info(soup, ContactInfo()).address == '12 High Street, London'